@@ -2,20 +2,24 @@ import requests
 import re
 from datetime import datetime
 from datetime import timedelta
-from random import shuffle
+from random import sample
 import traceback
 
 import logging
 import threading
 from flask import Flask, jsonify, Response
 from flask_caching import Cache
-from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from time import sleep
 from collections import OrderedDict
+from functools import lru_cache
 import os
 import json
 import subprocess
 import semantic_version
+import orjson
 
 app = Flask(__name__)
 
@@ -25,6 +29,19 @@ logger = logging.getLogger(__name__)
 # Suppress only the single InsecureRequestWarning from urllib3
 requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
 
+# Shared HTTP session so connections to the same host are kept alive and reused across requests.
+# pool_connections is how many per-host pools are kept, sized above the number of distinct endpoint hosts in the
+# registry so pools aren't evicted mid-cycle; pool_maxsize is how many idle connections each host's pool keeps
+# for threads hitting that host at once. Retries are disabled so a failing endpoint costs one timeout instead of several
+SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=1024,
+    pool_maxsize=256,
+    max_retries=Retry(total=0, connect=0, read=False),
+)
+SESSION.mount("http://", _http_adapter)
+SESSION.mount("https://", _http_adapter)
+
 # Initialize cache
 cache = Cache(app, config={"CACHE_TYPE": "simple"})
 
@@ -32,31 +49,61 @@ cache = Cache(app, config={"CACHE_TYPE": "simple"})
 # repo_path = ""
 # repo_retain_hours = int(os.environ.get('REPO_RETAIN_HOURS', 3))
 
-# Initialize number of workers
+# Initialize number of workers, NUM_WORKERS is the share of the health probe pool given to each concurrent network
 num_workers = int(os.environ.get("NUM_WORKERS", 10))
 
+# Number of networks processed concurrently
+num_network_workers = int(os.environ.get("NUM_NETWORK_WORKERS", 32))
+
+# Endpoint health probes from every network share one pool instead of each network creating its own,
+# by default sized to the total capacity of one NUM_WORKERS pool per concurrent network
+num_probe_workers = int(os.environ.get("NUM_PROBE_WORKERS", num_workers * num_network_workers))
+probe_executor = ThreadPoolExecutor(max_workers=num_probe_workers)
+endpoint_probes_lock = threading.Lock()
+
 GITHUB_API_URL = "https://api.github.com"
 GITHUB_API_BASE_URL = GITHUB_API_URL + "/repos/cosmos/chain-registry/contents"
 
 # these servers have given consistent error responses, this list is used to skip them
-SERVER_BLACKLIST = [
-    "https://stride.api.bccnodes.com:443",
-    "https://api.omniflix.nodestake.top",
-    "https://cosmos-lcd.quickapi.com:443",
-    "https://osmosis.rpc.stakin-nodes.com:443",
-]
+SERVER_BLACKLIST = frozenset(
+    {
+        "https://stride.api.bccnodes.com:443",
+        "https://api.omniflix.nodestake.top",
+        "https://cosmos-lcd.quickapi.com:443",
+        "https://osmosis.rpc.stakin-nodes.com:443",
+    }
+)
 
 NETWORKS_NO_GOV_MODULE = [
     "noble",
     "nobletestnet",
 ]
 
+# (connect, read) timeouts for health checks, a probe never waits longer on a host than the old single 1s timeout
+HEALTH_CHECK_TIMEOUT = (1, 1)
+
+# (connect, read) timeouts for upgrade queries, so requests abandoned after a race still release their connection
+REST_QUERY_TIMEOUT = (1, 5)
+
+# Repo tag fetches in flight, keyed by repo url, so concurrent lookups of the same repo share one request
+repo_tag_fetches = {}
+repo_tag_fetches_lock = threading.Lock()
+
 # Global variables to store the data for mainnets and testnets
 MAINNET_DATA = []
 TESTNET_DATA = []
 
+# Results of the update cycle in progress, served by the /progress routes as each network finishes
+CYCLE_PROGRESS = {
+    "MAINNET": {"complete": False, "error": None, "results": []},
+    "TESTNET": {"complete": False, "error": None, "results": []},
+}
+cycle_progress_lock = threading.Lock()
+
 SEMANTIC_VERSION_PATTERN = re.compile(r"(v\d+(?:\.\d+){0,2})")
 
+LATEST_BLOCK_HEIGHT_PATTERN = re.compile(rb'"latest_block_height"\s*:\s*"?(\d+)')
+
 
 class RequiresGovV1Exception(Exception):
     pass
@@ -109,54 +156,88 @@ def fetch_repo():
     return repo_dir
 
 
-def get_healthy_rpc_endpoints(rpc_endpoints):
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        healthy_rpc_endpoints = [
-            rpc
-            for rpc, is_healthy in executor.map(
-                lambda rpc: (rpc, is_rpc_endpoint_healthy(rpc["address"])), rpc_endpoints
-            )
-            if is_healthy
-        ]
+def get_healthy_endpoints(rpc_endpoints, rest_endpoints, endpoint_probes=None):
+    """Return the healthy RPC and REST endpoints, reusing probes of the same addresses from endpoint_probes."""
+    rpc_health, rest_health = probe_endpoints(
+        {rpc["address"] for rpc in rpc_endpoints}, {rest["address"] for rest in rest_endpoints}, endpoint_probes
+    )
 
-    return healthy_rpc_endpoints[:5]  # Select the first 5 healthy RPC endpoints
+    healthy_rpc_endpoints = [rpc for rpc in rpc_endpoints if rpc_health.get(rpc["address"])]
+    healthy_rest_endpoints = [rest for rest in rest_endpoints if rest_health.get(rest["address"])]
 
+    # Select the first 5 healthy RPC and REST endpoints
+    return healthy_rpc_endpoints[:5], healthy_rest_endpoints[:5]
+
+
+def new_endpoint_probes():
+    """Return an empty map of in-flight probes, shared by every network of one update cycle."""
+    return {"rpc": {}, "rest": {}}
+
+
+def submit_endpoint_probe(probes, address, health_check):
+    """Start a probe of address on the shared probe pool, or return the one already started for it."""
+    with endpoint_probes_lock:
+        future = probes.get(address)
+        if future is None:
+            future = probe_executor.submit(health_check, address)
+            probes[address] = future
+    return future
 
-def get_healthy_rest_endpoints(rest_endpoints):
-    with ThreadPoolExecutor(max_workers=num_workers) as executor:
-        healthy_rest_endpoints = [
-            rest
-            for rest, is_healthy in executor.map(
-                lambda rest: (rest, is_rest_endpoint_healthy(rest["address"])),
-                rest_endpoints,
-            )
-            if is_healthy
-        ]
 
-    return healthy_rest_endpoints[:5]  # Select the first 5 healthy REST endpoints
+def probe_endpoints(rpc_addresses, rest_addresses, endpoint_probes=None):
+    """Probe each RPC and REST address once on the shared probe pool and map it to whether it is healthy."""
+    if endpoint_probes is None:
+        endpoint_probes = new_endpoint_probes()
+    # addresses shared with other networks this cycle wait on the probe that is already running
+    rpc_futures = {
+        address: submit_endpoint_probe(endpoint_probes["rpc"], address, is_rpc_endpoint_healthy)
+        for address in rpc_addresses
+    }
+    rest_futures = {
+        address: submit_endpoint_probe(endpoint_probes["rest"], address, is_rest_endpoint_healthy)
+        for address in rest_addresses
+    }
+
+    rpc_health = {address: future.result() for address, future in rpc_futures.items()}
+    rest_health = {address: future.result() for address, future in rest_futures.items()}
+    return rpc_health, rest_health
+
+
+def get_health_status_code(url, session=SESSION):
+    """GET url for a health check and return its status code."""
+    # the body is read in full so the connection goes back to the pool for the queries that follow the probe
+    return session.get(url, timeout=HEALTH_CHECK_TIMEOUT, verify=False).status_code
 
 
-def is_rpc_endpoint_healthy(endpoint):
+def is_rpc_endpoint_healthy(endpoint, session=SESSION):
     try:
-        response = requests.get(f"{endpoint}/abci_info", timeout=1, verify=False)
-        if response.status_code != 200:
-            response = requests.get(f"{endpoint}/health", timeout=1, verify=False)
-        return response.status_code == 200
+        status_code = get_health_status_code(f"{endpoint}/abci_info", session)
+        if status_code != 200:
+            status_code = get_health_status_code(f"{endpoint}/health", session)
+        return status_code == 200
+    except requests.ConnectTimeout:
+        logger.debug(f"Health check connect timeout for rpc endpoint {endpoint}")
+        return False
+    except requests.ReadTimeout:
+        logger.debug(f"Health check read timeout for rpc endpoint {endpoint}")
+        return False
     except Exception:
         return False
 
 
-def is_rest_endpoint_healthy(endpoint):
+def is_rest_endpoint_healthy(endpoint, session=SESSION):
     try:
-        response = requests.get(f"{endpoint}/health", timeout=1, verify=False)
+        status_code = get_health_status_code(f"{endpoint}/health", session)
         # some chains dont implement the /health endpoint. Should we just skip /health and go directly to the below?
-        if response.status_code != 200:
-            response = requests.get(
-                f"{endpoint}/cosmos/base/tendermint/v1beta1/node_info",
-                timeout=1,
-                verify=False,
-            )
-        return response.status_code == 200
+        if status_code != 200:
+            status_code = get_health_status_code(f"{endpoint}/cosmos/base/tendermint/v1beta1/node_info", session)
+        return status_code == 200
+    except requests.ConnectTimeout:
+        logger.debug(f"Health check connect timeout for rest endpoint {endpoint}")
+        return False
+    except requests.ReadTimeout:
+        logger.debug(f"Health check read timeout for rest endpoint {endpoint}")
+        return False
     except Exception:
         return False
 
@@ -164,9 +245,15 @@ def is_rest_endpoint_healthy(endpoint):
 def get_latest_block_height_rpc(rpc_url):
     """Fetch the latest block height from the RPC endpoint."""
     try:
-        response = requests.get(f"{rpc_url}/status", timeout=1)
+        response = SESSION.get(f"{rpc_url}/status", timeout=1)
         response.raise_for_status()
-        data = response.json()
+
+        # only the height is needed, pull it straight from the body instead of decoding the whole status object
+        match = LATEST_BLOCK_HEIGHT_PATTERN.search(response.content)
+        if match:
+            return int(match.group(1))
+
+        data = orjson.loads(response.content)
 
         if "result" in data.keys():
             data = data["result"]
@@ -183,9 +270,9 @@ def get_block_time_rpc(rpc_url, height, allow_retry=False):
     """Fetch the block header time for a given block height from the RPC endpoint."""
     response = None
     try:
-        response = requests.get(f"{rpc_url}/block?height={height}", timeout=2)
+        response = SESSION.get(f"{rpc_url}/block?height={height}", timeout=2)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if "result" in data.keys():
             data = data["result"]
@@ -205,9 +292,9 @@ def get_block_time_rpc(rpc_url, height, allow_retry=False):
                     height = (
                         int(error_message.get("error", {}).get("data", "").split("lowest height is ")[1].strip()) + 20
                     )
-                    response = requests.get(f"{rpc_url}/block?height={height}", timeout=1)
+                    response = SESSION.get(f"{rpc_url}/block?height={height}", timeout=1)
                     response.raise_for_status()
-                    data = response.json()
+                    data = orjson.loads(response.content)
 
                     if "result" in data.keys():
                         data = data["result"]
@@ -250,6 +337,18 @@ def reorder_data(data):
     return ordered_data
 
 
+def order_results(results):
+    """Sort network results with found upgrades first and reorder each result's fields for the API."""
+    results = [r for r in results if r is not None]
+    sorted_results = sorted(results, key=lambda x: x["upgrade_found"], reverse=True)
+    return [reorder_data(result) for result in sorted_results]
+
+
+def build_response_body(results):
+    """Sort and serialize network results into the JSON body served by the API."""
+    return json.dumps(order_results(results)) + "\n"
+
+
 def fetch_all_endpoints(network_type, base_url, request_data):
     """Fetch all the REST and RPC endpoints for all networks and store in a map."""
     networks = request_data.get("MAINNETS", []) if network_type == "mainnet" else request_data.get("TESTNETS", [])
@@ -263,10 +362,10 @@ def fetch_all_endpoints(network_type, base_url, request_data):
 def fetch_endpoints(network, base_url):
     """Fetch the REST and RPC endpoints for a given network."""
     try:
-        response = requests.get(f"{base_url}/{network}/chain.json")
+        response = SESSION.get(f"{base_url}/{network}/chain.json")
         print(f"{base_url}/{network}/chain.json")
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         rest_endpoints = data.get("apis", {}).get("rest", [])
         rpc_endpoints = data.get("apis", {}).get("rpc", [])
         return rest_endpoints, rpc_endpoints
@@ -287,7 +386,9 @@ def fetch_active_upgrade_proposals(rest_url, network, network_repo_url):
 
 def fetch_active_upgrade_proposals_v1beta1(rest_url, network, network_repo_url):
     try:
-        response = requests.get(f"{rest_url}/cosmos/gov/v1beta1/proposals?proposal_status=2", verify=False)
+        response = SESSION.get(
+            f"{rest_url}/cosmos/gov/v1beta1/proposals?proposal_status=2", timeout=REST_QUERY_TIMEOUT, verify=False
+        )
 
         # Handle 501 Server Error
         if response.status_code == 501:
@@ -297,14 +398,14 @@ def fetch_active_upgrade_proposals_v1beta1(rest_url, network, network_repo_url):
         if response.status_code != 200:
             response_json = {}
             try:
-                response_json = response.json()
+                response_json = orjson.loads(response.content)
             except Exception:
                 pass
             if "message" in response_json and "can't convert" in response_json["message"]:
                 raise RequiresGovV1Exception("gov v1 is required")
 
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         for proposal in data.get("proposals", []):
             content = proposal.get("content", {})
@@ -346,14 +447,16 @@ def fetch_active_upgrade_proposals_v1beta1(rest_url, network, network_repo_url):
 
 def fetch_active_upgrade_proposals_v1(rest_url, network, network_repo_url):
     try:
-        response = requests.get(f"{rest_url}/cosmos/gov/v1/proposals?proposal_status=2", verify=False)
+        response = SESSION.get(
+            f"{rest_url}/cosmos/gov/v1/proposals?proposal_status=2", timeout=REST_QUERY_TIMEOUT, verify=False
+        )
 
         # Handle 501 Server Error
         if response.status_code == 501:
             return None, None
 
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         for proposal in data.get("proposals", []):
             messages = proposal.get("messages", [])
@@ -395,9 +498,11 @@ def fetch_active_upgrade_proposals_v1(rest_url, network, network_repo_url):
 
 def fetch_current_upgrade_plan(rest_url, network, network_repo_url):
     try:
-        response = requests.get(f"{rest_url}/cosmos/upgrade/v1beta1/current_plan", verify=False)
+        response = SESSION.get(
+            f"{rest_url}/cosmos/upgrade/v1beta1/current_plan", timeout=REST_QUERY_TIMEOUT, verify=False
+        )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         plan = data.get("plan", {})
         if plan:
@@ -428,6 +533,27 @@ def fetch_current_upgrade_plan(rest_url, network, network_repo_url):
         raise e
 
 
+def fetch_upgrade_info(rest_url, network, network_repo_url):
+    """Query the active upgrade proposals and the current upgrade plan from a REST endpoint."""
+    active_upgrade_check_failed = False
+    upgrade_plan_check_failed = False
+    try:
+        if network in NETWORKS_NO_GOV_MODULE:
+            raise Exception("Network does not have gov module")
+        active_upgrade = fetch_active_upgrade_proposals(rest_url, network, network_repo_url)
+    except Exception:
+        active_upgrade = (None, None, None)
+        active_upgrade_check_failed = True
+
+    try:
+        current_upgrade = fetch_current_upgrade_plan(rest_url, network, network_repo_url)
+    except Exception:
+        current_upgrade = (None, None, None, None)
+        upgrade_plan_check_failed = True
+
+    return active_upgrade, current_upgrade, active_upgrade_check_failed, upgrade_plan_check_failed
+
+
 def fetch_network_repo_tags(network, network_repo):
     if "github.com" in network_repo:
         try:
@@ -440,8 +566,8 @@ def fetch_network_repo_tags(network, network_repo):
                 return []
 
             tags_url = GITHUB_API_URL + f"/repos/{repo_owner}/{repo_name}/tags"
-            tags = requests.get(tags_url)
-            return list(map(lambda tag: tag["name"], tags.json()))
+            tags = SESSION.get(tags_url, timeout=REST_QUERY_TIMEOUT)
+            return list(map(lambda tag: tag["name"], orjson.loads(tags.content)))
         except Exception as e:
             print(f"Could not fetch tags from github for network {network}")
             print(e)
@@ -451,30 +577,63 @@ def fetch_network_repo_tags(network, network_repo):
         return []
 
 
-def get_network_repo_semver_tags(network, network_repo_url):
+def get_network_repo_tag_strings(network, network_repo_url):
+    """Return the repo's tags from the cache, or fetch them once even when several threads miss at the same time."""
     cached_tags = cache.get(network_repo_url + "_tags")
-    if not cached_tags:
-        network_repo_tag_strings = fetch_network_repo_tags(network, network_repo_url)
-        # cache response from network repo url to reduce api calls to whatever service is hosting the repo
-        cache.set(network_repo_url + "_tags", network_repo_tag_strings, timeout=600)
-    else:
-        network_repo_tag_strings = cached_tags
+    if cached_tags:
+        return cached_tags
+
+    with repo_tag_fetches_lock:
+        # another thread may have filled the cache while this one waited for the lock
+        cached_tags = cache.get(network_repo_url + "_tags")
+        if cached_tags:
+            return cached_tags
+        tag_fetch = repo_tag_fetches.get(network_repo_url)
+        owns_fetch = tag_fetch is None
+        if owns_fetch:
+            tag_fetch = Future()
+            repo_tag_fetches[network_repo_url] = tag_fetch
+
+    if owns_fetch:
+        try:
+            network_repo_tag_strings = fetch_network_repo_tags(network, network_repo_url)
+            # cache response from network repo url to reduce api calls to whatever service is hosting the repo
+            cache.set(network_repo_url + "_tags", network_repo_tag_strings, timeout=600)
+            tag_fetch.set_result(network_repo_tag_strings)
+        except Exception as e:
+            tag_fetch.set_exception(e)
+        finally:
+            with repo_tag_fetches_lock:
+                del repo_tag_fetches[network_repo_url]
+
+    return tag_fetch.result()
+
+
+def get_network_repo_semver_tags(network, network_repo_url):
+    network_repo_tag_strings = get_network_repo_tag_strings(network, network_repo_url)
 
     network_repo_semver_tags = []
     for tag in network_repo_tag_strings:
         # only use semantic version tags
-        try:
-            if tag.startswith("v"):
-                version = semantic_version.Version(tag[1:])
-            else:
-                version = semantic_version.Version(tag)
+        version = parse_semver_tag(tag)
+        if version is not None:
             network_repo_semver_tags.append(version)
-        except Exception:
-            pass
 
     return network_repo_semver_tags
 
 
+@lru_cache(maxsize=4096)
+def parse_semver_tag(tag):
+    """Parse a repo tag into a semantic version, or None if it is not one."""
+    # the same tags are parsed again on every update cycle, memoize the results
+    try:
+        if tag.startswith("v"):
+            return semantic_version.Version(tag[1:])
+        return semantic_version.Version(tag)
+    except Exception:
+        return None
+
+
 def find_best_semver_for_versions(network, network_version_strings, network_repo_semver_tags):
     if len(network_repo_semver_tags) == 0:
         return max(network_version_strings, key=len)
@@ -528,25 +687,49 @@ def find_best_semver_for_versions(network, network_version_strings, network_repo
     return max(network_version_strings, key=len)
 
 
-def fetch_data_for_networks_wrapper(network, network_type, repo_path):
+def get_chain_json_path(network, network_type, repo_path):
+    """Construct the path to the chain.json file based on network type."""
+    if network_type == "mainnet":
+        return os.path.join(repo_path, network, "chain.json")
+    elif network_type == "testnet":
+        return os.path.join(repo_path, "testnets", network, "chain.json")
+    else:
+        raise ValueError(f"Invalid network type: {network_type}")
+
+
+def load_chain_data(jobs, repo_path):
+    """Parse the chain.json of every network once per cycle, keyed by (network, network_type)."""
+    chain_data = {}
+    for network, network_type in jobs:
+        try:
+            with open(get_chain_json_path(network, network_type, repo_path), "r") as file:
+                chain_data[(network, network_type)] = orjson.loads(file.read())
+        except FileNotFoundError:
+            # fetch_data_for_network reports missing chain.json files for the network
+            continue
+        except Exception as e:
+            # fetch_data_for_network retries the parse with the json module, which accepts e.g. NaN
+            print(f"Failed to parse chain.json for network {network}: {e}")
+            continue
+    return chain_data
+
+
+def fetch_data_for_networks_wrapper(network, network_type, repo_path, endpoint_probes=None, chain_data=None):
     """Wrapper function for fetching data for a given network. Prints the chain name that is erroring out for better visibility"""
     try:
-        return fetch_data_for_network(network, network_type, repo_path)
+        return fetch_data_for_network(network, network_type, repo_path, endpoint_probes, chain_data)
     except Exception as e:
         print(f"Error fetching data for network {network}: {e}")
         raise e
 
 
-def fetch_data_for_network(network, network_type, repo_path):
-    """Fetch data for a given network."""
+def fetch_data_for_network(network, network_type, repo_path, endpoint_probes=None, chain_data=None):
+    """Fetch data for a given network.
 
-    # Construct the path to the chain.json file based on network type
-    if network_type == "mainnet":
-        chain_json_path = os.path.join(repo_path, network, "chain.json")
-    elif network_type == "testnet":
-        chain_json_path = os.path.join(repo_path, "testnets", network, "chain.json")
-    else:
-        raise ValueError(f"Invalid network type: {network_type}")
+    endpoint_probes holds the probes already started this cycle and chain_data the parsed chain.json when available.
+    """
+
+    chain_json_path = get_chain_json_path(network, network_type, repo_path)
     output_data = {}
     err_output_data = {
         "network": network,
@@ -555,17 +738,26 @@ def fetch_data_for_network(network, network_type, repo_path):
         "upgrade_found": False,
     }
 
-    # Check if the chain.json file exists
-    if not os.path.exists(chain_json_path):
-        print(f"chain.json not found for network {network}. Skipping...")
-        err_output_data["error"] = (
-            f"insufficient data in Cosmos chain registry, chain.json not found for {network}. Consider a PR to cosmos/chain-registry"
-        )
-        return err_output_data
+    data = chain_data
+    if data is None:
+        # Check if the chain.json file exists
+        if not os.path.exists(chain_json_path):
+            print(f"chain.json not found for network {network}. Skipping...")
+            err_output_data["error"] = (
+                f"insufficient data in Cosmos chain registry, chain.json not found for {network}. Consider a PR to cosmos/chain-registry"
+            )
+            return err_output_data
 
-    # Load the chain.json data
-    with open(chain_json_path, "r") as file:
-        data = json.load(file)
+        # Load the chain.json data
+        try:
+            with open(chain_json_path, "r") as file:
+                data = json.load(file)
+        except Exception as e:
+            print(f"Failed to parse chain.json for network {network}: {e}")
+            err_output_data["error"] = (
+                f"insufficient data in Cosmos chain registry, chain.json could not be parsed for {network}. Consider a PR to cosmos/chain-registry"
+            )
+            return err_output_data
 
     network_repo_url = data.get("codebase", {}).get("git_repo", None)
 
@@ -574,8 +766,9 @@ def fetch_data_for_network(network, network_type, repo_path):
 
     # Prioritize RPC endpoints for fetching the latest block height
     latest_block_height = -1
-    healthy_rpc_endpoints = get_healthy_rpc_endpoints(rpc_endpoints)
-    healthy_rest_endpoints = get_healthy_rest_endpoints(rest_endpoints)
+    healthy_rpc_endpoints, healthy_rest_endpoints = get_healthy_endpoints(
+        rpc_endpoints, rest_endpoints, endpoint_probes
+    )
 
     if len(healthy_rpc_endpoints) == 0:
         print(
@@ -586,16 +779,23 @@ def fetch_data_for_network(network, network_type, repo_path):
         )
         return err_output_data
 
-    # Shuffle the healthy endpoints
-    shuffle(healthy_rpc_endpoints)
-    shuffle(healthy_rest_endpoints)
-
+    # Query all healthy RPC endpoints at once and use the first one that returns a height
     rpc_server_used = ""
-    for rpc_endpoint in healthy_rpc_endpoints:
-        latest_block_height = get_latest_block_height_rpc(rpc_endpoint["address"])
-        if latest_block_height > 0:
-            rpc_server_used = rpc_endpoint["address"]
-            break
+    executor = ThreadPoolExecutor(max_workers=len(healthy_rpc_endpoints))
+    try:
+        futures = {
+            executor.submit(get_latest_block_height_rpc, rpc_endpoint["address"]): rpc_endpoint
+            for rpc_endpoint in healthy_rpc_endpoints
+        }
+        for future in as_completed(futures):
+            block_height = future.result()
+            if block_height > 0:
+                latest_block_height = block_height
+                rpc_server_used = futures[future]["address"]
+                break
+    finally:
+        # don't wait on slower endpoints once there is an answer, pending queries are cancelled
+        executor.shutdown(wait=False, cancel_futures=True)
 
     if latest_block_height < 0:
         print(
@@ -628,117 +828,95 @@ def fetch_data_for_network(network, network_type, repo_path):
     source = ""
     rest_server_used = ""
 
-    for index, rest_endpoint in enumerate(healthy_rest_endpoints):
-        current_endpoint = rest_endpoint["address"]
-
-        if current_endpoint in SERVER_BLACKLIST:
-            continue
-
-        active_upgrade_check_failed = False
-        upgrade_plan_check_failed = False
-        try:
-            if network in NETWORKS_NO_GOV_MODULE:
-                raise Exception("Network does not have gov module")
-            (
-                active_upgrade_name,
-                active_upgrade_version,
-                active_upgrade_height,
-            ) = fetch_active_upgrade_proposals(current_endpoint, network, network_repo_url)
-
-        except Exception:
+    # Query all healthy REST endpoints at once and use the first one that gives a usable answer
+    rest_endpoints_to_query = [
+        rest_endpoint for rest_endpoint in healthy_rest_endpoints if rest_endpoint["address"] not in SERVER_BLACKLIST
+    ]
+    executor = ThreadPoolExecutor(max_workers=max(len(rest_endpoints_to_query), 1))
+    try:
+        futures = {
+            executor.submit(fetch_upgrade_info, rest_endpoint["address"], network, network_repo_url): rest_endpoint
+            for rest_endpoint in rest_endpoints_to_query
+        }
+        for future in as_completed(futures):
+            current_endpoint = futures[future]["address"]
             (
-                active_upgrade_name,
-                active_upgrade_version,
-                active_upgrade_height,
-            ) = (None, None, None)
-            active_upgrade_check_failed = True
+                (active_upgrade_name, active_upgrade_version, active_upgrade_height),
+                (current_upgrade_name, current_upgrade_version, current_upgrade_height, current_plan_dump),
+                active_upgrade_check_failed,
+                upgrade_plan_check_failed,
+            ) = future.result()
 
-        try:
-            (
-                current_upgrade_name,
-                current_upgrade_version,
-                current_upgrade_height,
-                current_plan_dump,
-            ) = fetch_current_upgrade_plan(current_endpoint, network, network_repo_url)
-        except Exception:
-            (
-                current_upgrade_name,
-                current_upgrade_version,
-                current_upgrade_height,
-                current_plan_dump,
-            ) = (None, None, None, None)
-            upgrade_plan_check_failed = True
-
-        if active_upgrade_check_failed and upgrade_plan_check_failed:
-            if index + 1 < len(healthy_rest_endpoints):
+            if active_upgrade_check_failed and upgrade_plan_check_failed:
                 print(f"Failed to query rest endpoints {current_endpoint}, trying next rest endpoint")
                 continue
-            else:
-                print(f"Failed to query rest endpoints {current_endpoint}, all out of endpoints to try")
-                break
 
-        if active_upgrade_check_failed and network not in NETWORKS_NO_GOV_MODULE:
-            print(f"Failed to query active upgrade endpoint {current_endpoint}, trying next rest endpoint")
-            continue
+            if active_upgrade_check_failed and network not in NETWORKS_NO_GOV_MODULE:
+                print(f"Failed to query active upgrade endpoint {current_endpoint}, trying next rest endpoint")
+                continue
 
-        if (
-            active_upgrade_version
-            and (active_upgrade_height is not None)
-            and active_upgrade_height > latest_block_height
-        ):
-            upgrade_block_height = active_upgrade_height
-            upgrade_version = active_upgrade_version
-            upgrade_name = active_upgrade_name
-            source = "active_upgrade_proposals"
-            rest_server_used = current_endpoint
-            break
+            if (
+                active_upgrade_version
+                and (active_upgrade_height is not None)
+                and active_upgrade_height > latest_block_height
+            ):
+                upgrade_block_height = active_upgrade_height
+                upgrade_version = active_upgrade_version
+                upgrade_name = active_upgrade_name
+                source = "active_upgrade_proposals"
+                rest_server_used = current_endpoint
+                break
 
-        if (
-            current_upgrade_version
-            and (current_upgrade_height is not None)
-            and (current_plan_dump is not None)
-            and current_upgrade_height > latest_block_height
-        ):
-            upgrade_block_height = current_upgrade_height
-            upgrade_plan = json.loads(current_plan_dump)
-            upgrade_version = current_upgrade_version
-            upgrade_name = current_upgrade_name
-            source = "current_upgrade_plan"
-            rest_server_used = current_endpoint
-            # Extract the relevant information from the parsed JSON
-            info = {}
-            binaries = []
-            try:
-                info = json.loads(upgrade_plan.get("info", "{}"))
-                binaries = info.get("binaries", {})
-            except Exception:
-                print(f"Failed to parse binaries for network {network}. Non-fatal error, skipping...")
-                pass
+            if (
+                current_upgrade_version
+                and (current_upgrade_height is not None)
+                and (current_plan_dump is not None)
+                and current_upgrade_height > latest_block_height
+            ):
+                upgrade_block_height = current_upgrade_height
+                upgrade_plan = json.loads(current_plan_dump)
+                upgrade_version = current_upgrade_version
+                upgrade_name = current_upgrade_name
+                source = "current_upgrade_plan"
+                rest_server_used = current_endpoint
+                # Extract the relevant information from the parsed JSON
+                info = {}
+                binaries = []
+                try:
+                    info = json.loads(upgrade_plan.get("info", "{}"))
+                    binaries = info.get("binaries", {})
+                except Exception:
+                    print(f"Failed to parse binaries for network {network}. Non-fatal error, skipping...")
+                    pass
 
-            plan_height = upgrade_plan.get("height", -1)
-            try:
-                plan_height = int(plan_height)
-            except ValueError:
-                plan_height = -1
-
-            # Include the expanded information in the output data
-            output_data["upgrade_plan"] = {
-                "height": plan_height,
-                "binaries": binaries,
-                "name": upgrade_plan.get("name", None),
-                "upgraded_client_state": upgrade_plan.get("upgraded_client_state", None),
-            }
-            break
+                plan_height = upgrade_plan.get("height", -1)
+                try:
+                    plan_height = int(plan_height)
+                except ValueError:
+                    plan_height = -1
+
+                # Include the expanded information in the output data
+                output_data["upgrade_plan"] = {
+                    "height": plan_height,
+                    "binaries": binaries,
+                    "name": upgrade_plan.get("name", None),
+                    "upgraded_client_state": upgrade_plan.get("upgraded_client_state", None),
+                }
+                break
 
-        if not active_upgrade_version and not current_upgrade_version:
-            # this is where the "no upgrades found block runs"
-            rest_server_used = current_endpoint
-            break
+            if not active_upgrade_version and not current_upgrade_version:
+                # this is where the "no upgrades found block runs"
+                rest_server_used = current_endpoint
+                break
+    finally:
+        # don't wait on slower endpoints once there is an answer, pending queries are cancelled
+        executor.shutdown(wait=False, cancel_futures=True)
 
     current_block_time = None
     past_block_time = None
     avg_block_time_seconds = None
-    for rpc_endpoint in healthy_rpc_endpoints:
+    # Randomize the order so block time queries are spread across RPC endpoints
+    for rpc_endpoint in sample(healthy_rpc_endpoints, len(healthy_rpc_endpoints)):
         # Get average block time
         current_endpoint = rpc_endpoint["address"]
         current_block_time = get_block_time_rpc(current_endpoint, latest_block_height)
@@ -821,31 +999,57 @@ def update_data():
             if len(CHAIN_WATCH) != 0:
                 testnet_networks = [d for d in testnet_networks if d in CHAIN_WATCH]
 
-            with ThreadPoolExecutor() as executor:
-                testnet_data = list(
-                    filter(
-                        None,
-                        executor.map(
-                            lambda network, path: fetch_data_for_networks_wrapper(network, "testnet", path),
-                            testnet_networks,
-                            [repo_path] * len(testnet_networks),
-                        ),
-                    )
-                )
-                mainnet_data = list(
-                    filter(
-                        None,
-                        executor.map(
-                            lambda network, path: fetch_data_for_networks_wrapper(network, "mainnet", path),
-                            mainnet_networks,
-                            [repo_path] * len(mainnet_networks),
-                        ),
-                    )
-                )
+            jobs = [(network, "mainnet") for network in mainnet_networks] + [
+                (network, "testnet") for network in testnet_networks
+            ]
+
+            reset_cycle_progress()
+
+            # each network probes its own endpoints as it starts, sharing probes of addresses other networks use
+            chain_data = load_chain_data(jobs, repo_path)
+            endpoint_probes = new_endpoint_probes()
+
+            # Process mainnets and testnets together so the slowest network is the only thing we wait on
+            mainnet_data = []
+            testnet_data = []
+            with ThreadPoolExecutor(max_workers=num_network_workers) as executor:
+                futures = {
+                    executor.submit(
+                        fetch_data_for_networks_wrapper,
+                        network,
+                        network_type,
+                        repo_path,
+                        endpoint_probes,
+                        chain_data.get((network, network_type)),
+                    ): (network, network_type)
+                    for network, network_type in jobs
+                }
+                for future in as_completed(futures):
+                    if future.exception() is not None:
+                        # errors are already logged by the wrapper, report the network as failed rather than
+                        # failing the whole cycle
+                        network, network_type = futures[future]
+                        result = {
+                            "network": network,
+                            "type": network_type,
+                            "error": f"failed to fetch data for {network}: {future.exception()}",
+                            "upgrade_found": False,
+                        }
+                    else:
+                        result = future.result()
+                    if not result:
+                        continue
+                    if result["type"] == "mainnet":
+                        mainnet_data.append(result)
+                        record_cycle_progress("MAINNET", result)
+                    else:
+                        testnet_data.append(result)
+                        record_cycle_progress("TESTNET", result)
 
             # Update the Flask cache
-            cache.set("MAINNET_DATA", mainnet_data)
-            cache.set("TESTNET_DATA", testnet_data)
+            publish_network_data("MAINNET", mainnet_data)
+            publish_network_data("TESTNET", testnet_data)
+            complete_cycle_progress()
 
             elapsed_time = (datetime.now() - start_time).total_seconds()  # Calculate the elapsed time
             logger.info(f"Data update cycle completed in {elapsed_time} seconds. Sleeping for 1 minute...")
@@ -856,10 +1060,51 @@ def update_data():
             ).total_seconds()  # Calculate the elapsed time in case of an error
             traceback.print_exc()
             logger.error(f"Error in update_data loop after {elapsed_time} seconds: {e}")
+            # the cycle is over, don't leave /progress reporting a partial list as still running
+            complete_cycle_progress(error=f"update cycle failed: {e}")
             logger.error("Error encountered. Sleeping for 1 minute before retrying...")
             sleep(60)
 
 
+def publish_network_data(network_type_key, results):
+    """Store the serialized response body for MAINNET or TESTNET in the Flask cache."""
+    # Serialize once here so requests only have to return the cached body, nothing reads the raw results back
+    cache.set(f"{network_type_key}_RESPONSE", build_response_body(results))
+
+
+def reset_cycle_progress():
+    """Start tracking a new update cycle, the previous cycle's results stay served by /mainnets and /testnets."""
+    with cycle_progress_lock:
+        for network_type_key in CYCLE_PROGRESS:
+            CYCLE_PROGRESS[network_type_key] = {"complete": False, "error": None, "results": []}
+
+
+def record_cycle_progress(network_type_key, result):
+    """Add one finished network to the progress of the current cycle."""
+    with cycle_progress_lock:
+        CYCLE_PROGRESS[network_type_key]["results"].append(result)
+
+
+def complete_cycle_progress(error=None):
+    """Mark the current cycle's progress as complete, with the error that ended it early if there was one."""
+    with cycle_progress_lock:
+        for progress in CYCLE_PROGRESS.values():
+            progress["complete"] = True
+            progress["error"] = error
+
+
+def get_cycle_progress(network_type_key):
+    """Return the current cycle's progress for MAINNET or TESTNET, sorted and serialized only when requested."""
+    with cycle_progress_lock:
+        progress = CYCLE_PROGRESS[network_type_key]
+        complete = progress["complete"]
+        error = progress["error"]
+        results = list(progress["results"])
+
+    response_body = json.dumps({"complete": complete, "error": error, "results": order_results(results)}) + "\n"
+    return Response(response_body, content_type="application/json")
+
+
 def start_update_data_thread():
     update_thread = threading.Thread(target=update_data)
     update_thread.daemon = True
@@ -874,27 +1119,31 @@ def health_check():
 @app.route("/mainnets")
 # @cache.cached(timeout=600)  # Cache the result for 10 minutes
 def get_mainnet_data():
-    results = cache.get("MAINNET_DATA")
-    if results is None:
+    response_body = cache.get("MAINNET_RESPONSE")
+    if response_body is None:
         return jsonify({"error": "Data not available"}), 500
 
-    results = [r for r in results if r is not None]
-    sorted_results = sorted(results, key=lambda x: x["upgrade_found"], reverse=True)
-    reordered_results = [reorder_data(result) for result in sorted_results]
-    return Response(json.dumps(reordered_results) + "\n", content_type="application/json")
+    return Response(response_body, content_type="application/json")
 
 
 @app.route("/testnets")
 # @cache.cached(timeout=600)  # Cache the result for 10 minutes
 def get_testnet_data():
-    results = cache.get("TESTNET_DATA")
-    if results is None:
+    response_body = cache.get("TESTNET_RESPONSE")
+    if response_body is None:
         return jsonify({"error": "Data not available"}), 500
 
-    results = [r for r in results if r is not None]
-    sorted_results = sorted(results, key=lambda x: x["upgrade_found"], reverse=True)
-    reordered_results = [reorder_data(result) for result in sorted_results]
-    return Response(json.dumps(reordered_results) + "\n", content_type="application/json")
+    return Response(response_body, content_type="application/json")
+
+
+@app.route("/mainnets/progress")
+def get_mainnet_progress():
+    return get_cycle_progress("MAINNET")
+
+
+@app.route("/testnets/progress")
+def get_testnet_progress():
+    return get_cycle_progress("TESTNET")
 
 
 if __name__ == "__main__":